@@ -10,11 +10,15 @@ Date: 2025
 """
 
 import re
+import random
 import logging
+import functools
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Final, List, Optional, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+from types import MappingProxyType
 
 
 # Configure logging for production readiness
@@ -24,21 +28,103 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled tables and patterns used on the per-message path
+_SANITIZE_TABLE = str.maketrans('', '', '<>"\';')
+_ACCOUNT_RE = re.compile(r'^\d{10,12}$')
+_AMT_TABLE = str.maketrans('', '', '$,')
+_AMT_FLOAT_RE = re.compile(r'(?:\d+(?:\.\d*)?|\.\d+)')
+# Account numbers are tried first so their digits are not read as an amount
+_ENTITY_RE = re.compile(
+    r'\$?(?P<account_number>\b\d{10,12}\b)'
+    r'|\$?(?P<amount>\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
+)
+
+# Shared generator for picking canned responses
+_RNG = random.Random()
+
+# Static response texts
+_AUTH_REQUIRED_RESPONSE: Final = (
+    "For security purposes, I'll need to verify your identity first. "
+    "Please provide your account number or contact customer service at 1-800-SECURE."
+)
+
+_TRANSACTION_HISTORY_RESPONSE: Final = (
+    "Here are your recent transactions:\n"
+    "• Dec 15: Grocery Store - $85.42\n"
+    "• Dec 14: Online Transfer - $200.00\n"
+    "• Dec 13: ATM Withdrawal - $60.00\n"
+    "Would you like more details about any specific transaction?"
+)
+
+_TRANSFER_RESPONSE: Final = (
+    "I can help you with transfers. For security, please visit our secure "
+    "online portal or mobile app to complete transfers. You can also call "
+    "our customer service at 1-800-SECURE."
+)
+
+_LOAN_RESPONSE: Final = (
+    "We offer various loan products including:\n"
+    "• Personal loans (5.99% - 15.99% APR)\n"
+    "• Auto loans (3.49% - 7.99% APR)\n"
+    "• Home mortgages (competitive rates)\n"
+    "Would you like to speak with a loan specialist?"
+)
+
+_INVESTMENT_RESPONSE: Final = (
+    "Investment advice should be personalized to your financial situation. "
+    "I recommend speaking with one of our certified financial advisors. "
+    "Would you like me to schedule a consultation for you?"
+)
+
+_SUPPORT_RESPONSE: Final = (
+    "I'm here to help! For complex issues, you can:\n"
+    "• Call customer service: 1-800-SECURE\n"
+    "• Visit our website: www.securebank.com/support\n"
+    "• Chat with a specialist (Mon-Fri 8AM-8PM)\n"
+    "What specific issue can I help you with?"
+)
+
+_UNKNOWN_RESPONSE: Final = (
+    "I'm not sure I understand. I can help you with:\n"
+    "• Account balances and transactions\n"
+    "• Loan information\n"
+    "• General banking questions\n"
+    "• Connecting you with customer support\n"
+    "How can I assist you today?"
+)
+
+_EMPTY_MESSAGE_RESPONSE: Final = "I didn't receive a valid message. Please try again."
+
+_ERROR_RESPONSE: Final = (
+    "I apologize, but I encountered an error. Please try again or "
+    "contact customer support at 1-800-SECURE if the issue persists."
+)
+
+# Size of the exact-match caches for intents and entities; longer
+# messages are not cached so user text is not pinned in memory
+_MESSAGE_CACHE_SIZE = 1024
+_MAX_CACHED_MESSAGE_LEN = 256
+
+# Commands that end the interactive session in main()
+_QUIT_SENTINELS = frozenset({'quit', 'exit', 'q'})
+
 
-class IntentType(Enum):
+class IntentType(IntEnum):
     """Enumeration of supported chatbot intents"""
-    GREETING = "greeting"
-    ACCOUNT_BALANCE = "account_balance"
-    TRANSACTION_HISTORY = "transaction_history"
-    TRANSFER_MONEY = "transfer_money"
-    LOAN_INFO = "loan_info"
-    INVESTMENT_ADVICE = "investment_advice"
-    SUPPORT = "support"
-    GOODBYE = "goodbye"
-    UNKNOWN = "unknown"
-
-
-@dataclass
+    # Integer values hash as plain ints when used as dict keys; log
+    # intent.name.lower() for a readable label
+    GREETING = 1
+    ACCOUNT_BALANCE = 2
+    TRANSACTION_HISTORY = 3
+    TRANSFER_MONEY = 4
+    LOAN_INFO = 5
+    INVESTMENT_ADVICE = 6
+    SUPPORT = 7
+    GOODBYE = 8
+    UNKNOWN = 9
+
+
+@dataclass(slots=True)
 class UserSession:
     """Data class to manage user session state"""
     user_id: str
@@ -69,7 +155,7 @@ class SecurityValidator:
             return ""
         
         # Remove potentially harmful characters
-        sanitized = re.sub(r'[<>"\';]', '', user_input)
+        sanitized = user_input.translate(_SANITIZE_TABLE)
         return sanitized.strip()
     
     @staticmethod
@@ -84,8 +170,7 @@ class SecurityValidator:
             True if valid format, False otherwise
         """
         # Simple validation - in production, use more robust validation
-        pattern = r'^\d{10,12}$'
-        return bool(re.match(pattern, account_number))
+        return bool(_ACCOUNT_RE.match(account_number))
     
     @staticmethod
     def validate_amount(amount: str) -> Tuple[bool, float]:
@@ -98,27 +183,81 @@ class SecurityValidator:
         Returns:
             Tuple of (is_valid, parsed_amount)
         """
-        try:
-            parsed_amount = float(amount.replace('$', '').replace(',', ''))
-            return parsed_amount > 0, parsed_amount
-        except (ValueError, AttributeError):
+        if not isinstance(amount, str):
             return False, 0.0
+        
+        # Strip currency formatting and reject non-numeric text up front
+        # rather than letting float() raise
+        stripped = amount.translate(_AMT_TABLE).strip()
+        if not _AMT_FLOAT_RE.fullmatch(stripped):
+            return False, 0.0
+        
+        parsed_amount = float(stripped)
+        return parsed_amount > 0, parsed_amount
+
+
+def _scan_entities(message: str) -> Tuple[Tuple[str, str], ...]:
+    """Extract (entity, value) pairs from a message"""
+    entities = {}
+    
+    # Single pass over the message; keep the first amount and account number
+    for match in _ENTITY_RE.finditer(message):
+        name = match.lastgroup
+        if name not in entities:
+            entities[name] = match.group(name)
+            if len(entities) == 2:
+                break
+    
+    return tuple(entities.items())
+
+
+_cached_entities = functools.lru_cache(maxsize=_MESSAGE_CACHE_SIZE)(_scan_entities)
+
+
+# Intent keyword table; the first intent in order with a keyword present wins
+_INTENT_KEYWORDS: Final = {
+    IntentType.GREETING: ('hello', 'hi', 'hey', 'good morning', 'good afternoon'),
+    IntentType.ACCOUNT_BALANCE: ('balance', 'account balance', 'how much', 'funds'),
+    IntentType.TRANSACTION_HISTORY: ('transactions', 'history', 'statement', 'activity'),
+    IntentType.TRANSFER_MONEY: ('transfer', 'send money', 'pay', 'wire'),
+    IntentType.LOAN_INFO: ('loan', 'mortgage', 'credit', 'borrow'),
+    IntentType.INVESTMENT_ADVICE: ('invest', 'portfolio', 'stocks', 'bonds', 'mutual funds'),
+    IntentType.SUPPORT: ('help', 'support', 'customer service', 'problem'),
+    IntentType.GOODBYE: ('bye', 'goodbye', 'exit', 'quit', 'thank you')
+}
+
+
+def _scan_intent(user_input_lower: str) -> IntentType:
+    """Scan already-lowercased input for keywords, intent by intent"""
+    for intent, keywords in _INTENT_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword in user_input_lower:
+                return intent
+    
+    return IntentType.UNKNOWN
+
+
+_cached_intent = functools.lru_cache(maxsize=_MESSAGE_CACHE_SIZE)(_scan_intent)
 
 
 class IntentClassifier:
     """Natural Language Processing for intent classification"""
     
     def __init__(self):
-        """Initialize the intent classifier with keyword mappings"""
-        self.intent_keywords = {
-            IntentType.GREETING: ['hello', 'hi', 'hey', 'good morning', 'good afternoon'],
-            IntentType.ACCOUNT_BALANCE: ['balance', 'account balance', 'how much', 'funds'],
-            IntentType.TRANSACTION_HISTORY: ['transactions', 'history', 'statement', 'activity'],
-            IntentType.TRANSFER_MONEY: ['transfer', 'send money', 'pay', 'wire'],
-            IntentType.LOAN_INFO: ['loan', 'mortgage', 'credit', 'borrow'],
-            IntentType.INVESTMENT_ADVICE: ['invest', 'portfolio', 'stocks', 'bonds', 'mutual funds'],
-            IntentType.SUPPORT: ['help', 'support', 'customer service', 'problem'],
-            IntentType.GOODBYE: ['bye', 'goodbye', 'exit', 'quit', 'thank you']
+        """
+        Initialize the intent classifier with keyword mappings
+        
+        intent_keywords is a read-only view of the module-wide keyword
+        table, which is fixed and shared by every classifier.
+        """
+        self.intent_keywords = MappingProxyType(_INTENT_KEYWORDS)
+        
+        # Messages that are exactly one keyword ("hi", "balance", "help")
+        # resolve with a single hash lookup, ahead of the message cache
+        self._exact_intents = {
+            keyword: _scan_intent(keyword)
+            for keywords in _INTENT_KEYWORDS.values()
+            for keyword in keywords
         }
     
     def classify_intent(self, user_input: str) -> IntentType:
@@ -132,32 +271,64 @@ class IntentClassifier:
             Classified intent type
         """
         user_input_lower = user_input.lower()
+        intent = self._exact_intents.get(user_input_lower)
+        if intent is None:
+            if len(user_input_lower) <= _MAX_CACHED_MESSAGE_LEN:
+                intent = _cached_intent(user_input_lower)
+            else:
+                intent = _scan_intent(user_input_lower)
         
-        for intent, keywords in self.intent_keywords.items():
-            if any(keyword in user_input_lower for keyword in keywords):
-                logger.info(f"Intent classified: {intent.value}")
-                return intent
-        
-        logger.info("Intent classified: unknown")
-        return IntentType.UNKNOWN
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Intent classified: %s", intent.name.lower())
+        return intent
+
+
+# Intent -> (handler method name, takes session, takes extracted data)
+_DISPATCH: Final = {
+    IntentType.GREETING: ('_handle_greeting', False, False),
+    IntentType.ACCOUNT_BALANCE: ('_handle_balance_inquiry', True, False),
+    IntentType.TRANSACTION_HISTORY: ('_handle_transaction_history', True, False),
+    IntentType.TRANSFER_MONEY: ('_handle_transfer_request', False, True),
+    IntentType.LOAN_INFO: ('_handle_loan_inquiry', False, False),
+    IntentType.INVESTMENT_ADVICE: ('_handle_investment_inquiry', False, False),
+    IntentType.SUPPORT: ('_handle_support_request', False, False),
+    IntentType.GOODBYE: ('_handle_goodbye', False, False),
+    IntentType.UNKNOWN: ('_handle_unknown_intent', False, False)
+}
 
 
 class ResponseGenerator:
     """Generates contextual responses based on user intent"""
     
+    # Intents that require an authenticated session
+    _AUTH_REQUIRED = frozenset({
+        IntentType.ACCOUNT_BALANCE,
+        IntentType.TRANSACTION_HISTORY,
+        IntentType.TRANSFER_MONEY
+    })
+    
     def __init__(self):
         """Initialize response templates"""
         self.responses = {
-            IntentType.GREETING: [
+            IntentType.GREETING: (
                 "Hello! Welcome to SecureBank. How can I assist you today?",
                 "Hi there! I'm here to help with your banking needs. What can I do for you?",
                 "Good day! How may I help you with your financial services today?"
-            ],
-            IntentType.GOODBYE: [
+            ),
+            IntentType.GOODBYE: (
                 "Thank you for using SecureBank! Have a great day!",
                 "Goodbye! Feel free to reach out anytime you need assistance.",
                 "Take care! Remember, I'm here 24/7 for your banking needs."
-            ]
+            )
+        }
+        self._response_lens = {
+            intent: len(options) for intent, options in self.responses.items()
+        }
+        
+        # Bind the dispatch table once; call sites then need no closures
+        self._handlers = {
+            intent: (getattr(self, name), needs_session, needs_data)
+            for intent, (name, needs_session, needs_data) in _DISPATCH.items()
         }
     
     def generate_response(self, intent: IntentType, session: UserSession, 
@@ -177,35 +348,37 @@ class ResponseGenerator:
             extracted_data = {}
         
         # Handle authentication-required intents
-        if intent in [IntentType.ACCOUNT_BALANCE, IntentType.TRANSACTION_HISTORY, 
-                     IntentType.TRANSFER_MONEY] and not session.authenticated:
+        if intent in self._AUTH_REQUIRED and not session.authenticated:
             return self._request_authentication()
         
         # Generate intent-specific responses
-        response_map = {
-            IntentType.GREETING: lambda: self._get_random_response(IntentType.GREETING),
-            IntentType.ACCOUNT_BALANCE: lambda: self._handle_balance_inquiry(session),
-            IntentType.TRANSACTION_HISTORY: lambda: self._handle_transaction_history(session),
-            IntentType.TRANSFER_MONEY: lambda: self._handle_transfer_request(extracted_data),
-            IntentType.LOAN_INFO: lambda: self._handle_loan_inquiry(),
-            IntentType.INVESTMENT_ADVICE: lambda: self._handle_investment_inquiry(),
-            IntentType.SUPPORT: lambda: self._handle_support_request(),
-            IntentType.GOODBYE: lambda: self._get_random_response(IntentType.GOODBYE),
-            IntentType.UNKNOWN: lambda: self._handle_unknown_intent()
-        }
+        entry = self._handlers.get(intent)
+        if entry is None:
+            return self._handle_unknown_intent()
         
-        handler = response_map.get(intent, lambda: self._handle_unknown_intent())
+        handler, needs_session, needs_data = entry
+        if needs_session:
+            return handler(session)
+        if needs_data:
+            return handler(extracted_data)
         return handler()
     
     def _get_random_response(self, intent: IntentType) -> str:
         """Get a random response for the given intent"""
-        import random
-        return random.choice(self.responses[intent])
+        options = self.responses[intent]
+        return options[_RNG.randrange(self._response_lens[intent])]
+    
+    def _handle_greeting(self) -> str:
+        """Handle greetings"""
+        return self._get_random_response(IntentType.GREETING)
+    
+    def _handle_goodbye(self) -> str:
+        """Handle farewells"""
+        return self._get_random_response(IntentType.GOODBYE)
     
     def _request_authentication(self) -> str:
         """Request user authentication"""
-        return ("For security purposes, I'll need to verify your identity first. "
-                "Please provide your account number or contact customer service at 1-800-SECURE.")
+        return _AUTH_REQUIRED_RESPONSE
     
     def _handle_balance_inquiry(self, session: UserSession) -> str:
         """Handle account balance requests"""
@@ -215,62 +388,68 @@ class ResponseGenerator:
     
     def _handle_transaction_history(self, session: UserSession) -> str:
         """Handle transaction history requests"""
-        return ("Here are your recent transactions:\n"
-                "• Dec 15: Grocery Store - $85.42\n"
-                "• Dec 14: Online Transfer - $200.00\n"
-                "• Dec 13: ATM Withdrawal - $60.00\n"
-                "Would you like more details about any specific transaction?")
+        return _TRANSACTION_HISTORY_RESPONSE
     
     def _handle_transfer_request(self, extracted_data: Dict) -> str:
         """Handle money transfer requests"""
-        return ("I can help you with transfers. For security, please visit our secure "
-                "online portal or mobile app to complete transfers. You can also call "
-                "our customer service at 1-800-SECURE.")
+        return _TRANSFER_RESPONSE
     
     def _handle_loan_inquiry(self) -> str:
         """Handle loan information requests"""
-        return ("We offer various loan products including:\n"
-                "• Personal loans (5.99% - 15.99% APR)\n"
-                "• Auto loans (3.49% - 7.99% APR)\n"
-                "• Home mortgages (competitive rates)\n"
-                "Would you like to speak with a loan specialist?")
+        return _LOAN_RESPONSE
     
     def _handle_investment_inquiry(self) -> str:
         """Handle investment advice requests"""
-        return ("Investment advice should be personalized to your financial situation. "
-                "I recommend speaking with one of our certified financial advisors. "
-                "Would you like me to schedule a consultation for you?")
+        return _INVESTMENT_RESPONSE
     
     def _handle_support_request(self) -> str:
         """Handle customer support requests"""
-        return ("I'm here to help! For complex issues, you can:\n"
-                "• Call customer service: 1-800-SECURE\n"
-                "• Visit our website: www.securebank.com/support\n"
-                "• Chat with a specialist (Mon-Fri 8AM-8PM)\n"
-                "What specific issue can I help you with?")
+        return _SUPPORT_RESPONSE
     
     def _handle_unknown_intent(self) -> str:
         """Handle unrecognized user intents"""
-        return ("I'm not sure I understand. I can help you with:\n"
-                "• Account balances and transactions\n"
-                "• Loan information\n"
-                "• General banking questions\n"
-                "• Connecting you with customer support\n"
-                "How can I assist you today?")
+        return _UNKNOWN_RESPONSE
 
 
 class FintechChatbot:
     """Main chatbot class orchestrating all components"""
     
-    def __init__(self):
-        """Initialize chatbot with all required components"""
-        self.intent_classifier = IntentClassifier()
-        self.response_generator = ResponseGenerator()
-        self.security_validator = SecurityValidator()
-        self.active_sessions: Dict[str, UserSession] = {}
+    def __init__(self, max_sessions: int = 10_000):
+        """
+        Initialize chatbot session storage; components are built lazily
+        
+        Args:
+            max_sessions: Number of sessions kept before the least recently
+                used one is evicted
+            
+        Raises:
+            ValueError: If max_sessions is less than 1
+        """
+        if max_sessions < 1:
+            raise ValueError(f"max_sessions must be at least 1, got {max_sessions}")
+        
+        self.active_sessions: OrderedDict[str, UserSession] = OrderedDict()
+        self._max_sessions = max_sessions
         
         logger.info("Fintech Chatbot initialized successfully")
     
+    # Components are built on first use so that constructing the chatbot
+    # stays cheap for short-lived processes
+    @functools.cached_property
+    def intent_classifier(self) -> IntentClassifier:
+        """Intent classifier, built on first access"""
+        return IntentClassifier()
+    
+    @functools.cached_property
+    def response_generator(self) -> ResponseGenerator:
+        """Response generator, built on first access"""
+        return ResponseGenerator()
+    
+    @functools.cached_property
+    def security_validator(self) -> SecurityValidator:
+        """Security validator, built on first access"""
+        return SecurityValidator()
+    
     def create_session(self, user_id: str) -> UserSession:
         """
         Create a new user session
@@ -281,9 +460,15 @@ class FintechChatbot:
         Returns:
             New UserSession object
         """
+        if (user_id not in self.active_sessions
+                and len(self.active_sessions) >= self._max_sessions):
+            evicted_id, _ = self.active_sessions.popitem(last=False)
+            logger.info("Evicted least recently used session: %s", evicted_id)
+        
         session = UserSession(user_id=user_id)
         self.active_sessions[user_id] = session
-        logger.info(f"New session created for user: {user_id}")
+        self.active_sessions.move_to_end(user_id)
+        logger.info("New session created for user: %s", user_id)
         return session
     
     def get_session(self, user_id: str) -> UserSession:
@@ -296,7 +481,12 @@ class FintechChatbot:
         Returns:
             UserSession object
         """
-        return self.active_sessions.get(user_id) or self.create_session(user_id)
+        session = self.active_sessions.get(user_id)
+        if session is None:
+            return self.create_session(user_id)
+        
+        self.active_sessions.move_to_end(user_id)
+        return session
     
     def process_message(self, user_id: str, message: str) -> str:
         """
@@ -317,7 +507,7 @@ class FintechChatbot:
             sanitized_message = self.security_validator.sanitize_input(message)
             
             if not sanitized_message:
-                return "I didn't receive a valid message. Please try again."
+                return _EMPTY_MESSAGE_RESPONSE
             
             # Classify user intent
             intent = self.intent_classifier.classify_intent(sanitized_message)
@@ -331,13 +521,29 @@ class FintechChatbot:
                 intent, session, extracted_data
             )
             
-            logger.info(f"Processed message for user {user_id}: {intent.value}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Processed message for user %s: %s", user_id, intent.name.lower())
             return response
             
         except Exception as e:
-            logger.error(f"Error processing message: {str(e)}")
-            return ("I apologize, but I encountered an error. Please try again or "
-                   "contact customer support at 1-800-SECURE if the issue persists.")
+            logger.error("Error processing message: %s", e)
+            return _ERROR_RESPONSE
+    
+    def process_batch(self, messages: List[Tuple[str, str]]) -> List[str]:
+        """
+        Process a batch of user messages in order
+        
+        Each message goes through process_message, so an error in one
+        message only affects that message's response.
+        
+        Args:
+            messages: (user_id, message) pairs
+            
+        Returns:
+            Generated response strings, in the same order as the input
+        """
+        process = self.process_message
+        return [process(user_id, message) for user_id, message in messages]
     
     def _extract_entities(self, message: str) -> Dict:
         """
@@ -349,21 +555,13 @@ class FintechChatbot:
         Returns:
             Dictionary of extracted entities
         """
-        entities = {}
+        if len(message) <= _MAX_CACHED_MESSAGE_LEN:
+            entities = _cached_entities(message)
+        else:
+            entities = _scan_entities(message)
         
-        # Extract monetary amounts
-        amount_pattern = r'\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
-        amounts = re.findall(amount_pattern, message)
-        if amounts:
-            entities['amount'] = amounts[0]
-        
-        # Extract account numbers (simplified)
-        account_pattern = r'\b\d{10,12}\b'
-        accounts = re.findall(account_pattern, message)
-        if accounts:
-            entities['account_number'] = accounts[0]
-        
-        return entities
+        # Cached results are shared, so hand out a fresh dict
+        return dict(entities)
     
     def end_session(self, user_id: str) -> None:
         """
@@ -374,7 +572,7 @@ class FintechChatbot:
         """
         if user_id in self.active_sessions:
             del self.active_sessions[user_id]
-            logger.info(f"Session ended for user: {user_id}")
+            logger.info("Session ended for user: %s", user_id)
 
 
 def main():
@@ -394,14 +592,14 @@ def main():
             # Get user input
             user_input = input("You: ").strip()
             
-            if user_input.lower() in ['quit', 'exit', 'q']:
+            if not user_input:
+                continue
+            
+            if user_input.lower() in _QUIT_SENTINELS:
                 response = bot.process_message(user_id, "goodbye")
                 print(f"Bot: {response}")
                 break
             
-            if not user_input:
-                continue
-            
             # Process message and display response
             response = bot.process_message(user_id, user_input)
             print(f"Bot: {response}\n")